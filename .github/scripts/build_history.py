@@ -0,0 +1,29 @@
+"""TOMBSTONE - this module moved to ``scripts/build_history.py``.
+
+The hard stop is deliberately lazy (PEP 562): merely importing this module
+is free and side-effect free, so tooling that enumerates or introspects
+modules no longer pays for (or has to guard against) an abort at import
+time. Any actual attribute access, or running the file directly, still
+fails loudly with a pointer to the new location.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+_MESSAGE = (
+    "scripts/build_history.py is the canonical initiative history builder; "
+    "this copy under .github/scripts/ is a tombstone. Update your caller."
+)
+
+
+def _abort() -> None:
+    raise SystemExit(_MESSAGE)
+
+
+def __getattr__(name: str):  # sentinel, never returns
+    _abort()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _abort()
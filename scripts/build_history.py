@@ -0,0 +1,658 @@
+"""Build the initiative history index from GitHub issues.
+
+Fetches every issue labelled ``type:initiative`` in the org, parses the
+structured issue-form fields out of the body, distils lessons learned
+(root causes, mitigations, risks) and writes one JSONL entry per
+initiative. The resulting index feeds the lessons generator and the
+readiness tooling, so it is rebuilt whenever initiative issues change.
+
+Provide a token via ``--token`` or ``GITHUB_TOKEN``; see ``--help`` for
+the remaining knobs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import io
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # aiohttp powers the concurrent fetch path; the sync fallback needs only requests.
+    import aiohttp
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    aiohttp = None
+
+try:  # orjson serialises several times faster; stdlib json remains a full fallback.
+    import orjson
+
+    # Bytes all the way to the file: orjson emits UTF-8 directly, so the
+    # binary-mode writer never pays a str round trip per entry.
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+_DEFAULT_API = os.environ.get("GITHUB_API", "https://api.github.com")
+_DEFAULT_OUTPUT = Path(".spectra/history/initiatives.jsonl")
+_ETAG_CACHE = Path(".cache/history-etags.json")
+
+MAX_PAGES = 10
+PER_PAGE = 100
+INITIATIVE_LABEL = "type:initiative"
+# Below this many issues, process-pool startup costs more than it saves.
+PARALLEL_THRESHOLD = 32
+
+# Compiled once at import: the stdlib re cache is small and keyed by pattern
+# string, so per-call re.search/findall over thousands of issues would pay
+# repeated compile churn otherwise.
+_FIELD_NAMES = (
+    "archetype",
+    "domain",
+    "purpose",
+    "scope",
+    "constraints",
+    "stakeholders",
+    "dependencies",
+    "risks",
+    "successIndicators",
+    "outcomeStatus",
+    "postmortem",
+    "timeline",
+    "pillar",
+)
+# Scan once, dispatch by name: a single generic pass over the body captures
+# every section heading, and _FIELD_CASE decides which ones we keep. One
+# small pattern instead of a 13-way alternation keeps the scan cheap however
+# long the field list grows.
+_BODY_FIELDS_RE = re.compile(
+    r"###\s*(?P<name>[A-Za-z]+)"
+    r"\s*\n\s*(?P<content>.*?)(?=\n###|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_FIELD_CASE = {name.lower(): name for name in _FIELD_NAMES}
+# Root-cause and mitigation cues fused into one alternation: a single pass
+# over the postmortem text feeds both buckets, dispatched on which named
+# group matched.
+_POSTMORTEM_RE = re.compile(
+    r"(?P<cause>root\s*cause|caused\s+by|due\s+to|because\s+of)[:\s]+(?P<ctext>[^,\n]+)"
+    r"|(?P<mit>mitigation[s]?|to\s+prevent|solution|resolved\s+by)[:\s]+(?P<mtext>[^,\n]+)",
+    re.IGNORECASE,
+)
+_WORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+# frozenset membership is a single C-level hash probe; evaluated once at import.
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "are",
+        "but",
+        "not",
+        "you",
+        "all",
+        "can",
+        "had",
+        "her",
+        "was",
+        "one",
+        "our",
+        "out",
+        "day",
+        "get",
+        "has",
+        "him",
+        "his",
+        "how",
+        "man",
+        "new",
+        "now",
+        "old",
+        "see",
+        "two",
+        "way",
+        "who",
+        "its",
+        "did",
+        "yes",
+        "she",
+        "may",
+        "say",
+        "use",
+        "this",
+        "that",
+        "with",
+        "have",
+        "from",
+        "they",
+        "will",
+        "been",
+        "were",
+        "which",
+        "their",
+        "would",
+        "there",
+        "could",
+        "other",
+        "into",
+        "should",
+        "initiative",
+    }
+)
+_MARKDOWN_BULLET_RE = re.compile(r"^[-*]\s*", re.MULTILINE)
+# All risk cues in one alternation: a single scan per line replaces one
+# substring sweep per marker.
+_RISK_MARKER_RE = re.compile(r"risk|blocker|unknown|dependency|deadline")
+_DEFAULT_STATUS = {"open": "inProgress", "closed": "completed"}
+_INITIATIVE_TITLE_RE = re.compile(r"\[Initiative\]\s*([^[\n]+)")
+_LAST_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+
+# One POST per 100 issues, only the fields the parser reads, and the label
+# filter applied server-side - where REST pages cost one round trip each.
+_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $labels: [String!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, labels: $labels, states: [OPEN, CLOSED],
+           orderBy: {field: UPDATED_AT, direction: DESC}, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number title body state createdAt updatedAt url
+        labels(first: 20) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+
+class InitiativeHistoryBuilder:
+    """Turns initiative issues into structured history entries."""
+
+    def __init__(
+        self,
+        org: str,
+        repo: str,
+        token: str,
+        api_base: str = _DEFAULT_API,
+        verify_labels: bool = False,
+    ) -> None:
+        self.org = org
+        self.repo = repo
+        self.api_base = api_base.rstrip("/")
+        # The labels= filter is applied server-side on both transports, so
+        # the client-side re-check is pure defence; it is opt-in rather
+        # than a nested loop over every issue's labels on every build.
+        self._verify_labels = verify_labels
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "spectra-history-builder",
+        }
+        # Pooled session for the sync path: one TLS handshake for all pages,
+        # with retries absorbing transient 5xx and secondary rate limits.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(403, 429, 500, 502, 503, 504),
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount("https://", adapter)
+
+    # ------------------------------------------------------------------ fetch
+
+    def _load_page_cache(self) -> dict[str, Any]:
+        """Load the sidecar ETag cache ({"etags": {page: etag}, "pages": ...})."""
+        try:
+            return json.loads(_ETAG_CACHE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"etags": {}, "pages": {}}
+
+    def _save_page_cache(self, cache: dict[str, Any]) -> None:
+        try:
+            _ETAG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _ETAG_CACHE.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError:
+            pass  # The cache is an optimisation; never fail the build over it.
+
+    def _issues_url(self) -> str:
+        return f"{self.api_base}/repos/{self.org}/{self.repo}/issues"
+
+    def _base_params(self) -> dict[str, Any]:
+        return {
+            "state": "all",
+            "labels": INITIATIVE_LABEL,
+            "per_page": PER_PAGE,
+        }
+
+    async def _fetch_pages_async(self) -> list[dict[str, Any]]:
+        """Fetch all issue pages concurrently.
+
+        Page 1 is probed first so the ``Link`` header can tell us the real
+        page count; pages 2..N then go out in a single ``asyncio.gather``,
+        collapsing wall time from one round trip per page to roughly one
+        round trip overall.
+        """
+        url = self._issues_url()
+        params = self._base_params()
+        cache = self._load_page_cache()
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+
+            async def fetch_page(page: int) -> tuple[list[dict[str, Any]], str | None]:
+                headers = {}
+                etag = cache["etags"].get(str(page))
+                if etag:
+                    headers["If-None-Match"] = etag
+                async with session.get(
+                    url, params={**params, "page": page}, headers=headers
+                ) as page_resp:
+                    if page_resp.status == 304:
+                        # Unchanged since the last build: reuse the cached page
+                        # without downloading or parsing any bodies. None (not
+                        # "") signals that no Link header travelled with this
+                        # response.
+                        return cache["pages"].get(str(page), []), None
+                    page_resp.raise_for_status()
+                    link = page_resp.headers.get("Link", "") if page == 1 else ""
+                    page_issues = await page_resp.json()
+                    new_etag = page_resp.headers.get("ETag", "")
+                    if new_etag:
+                        cache["etags"][str(page)] = new_etag
+                        cache["pages"][str(page)] = page_issues
+                    return page_issues, link
+
+            first_page, link_header = await fetch_page(1)
+            if link_header is None:
+                # Page 1 was a 304, which carries no Link header; reuse the
+                # page count persisted when the listing last changed so the
+                # cached pages 2..N are still probed rather than dropped.
+                last_page = int(cache.get("last_page", 1))
+            else:
+                last_page = self._last_page_from_link(link_header)
+                cache["last_page"] = last_page
+            if not first_page or last_page <= 1:
+                self._save_page_cache(cache)
+                return first_page
+
+            remaining = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, min(last_page, MAX_PAGES) + 1))
+            )
+        issues = list(first_page)
+        for page_issues, _ in remaining:
+            if not page_issues:
+                break
+            issues.extend(page_issues)
+        self._save_page_cache(cache)
+        return issues
+
+    @staticmethod
+    def _last_page_from_link(link_header: str) -> int:
+        """Extract the ``rel="last"`` page number from a Link header."""
+        for part in link_header.split(","):
+            if 'rel="last"' in part:
+                match = _LAST_PAGE_RE.search(part)
+                if match:
+                    return int(match.group(1))
+        return 1
+
+    def _fetch_initiative_issues_sync(self) -> list[dict[str, Any]]:
+        """Sequential fallback used when aiohttp is unavailable."""
+        url = self._issues_url()
+        params = self._base_params()
+        cache = self._load_page_cache()
+        issues: list[dict[str, Any]] = []
+        for page in range(1, MAX_PAGES + 1):
+            headers = {}
+            etag = cache["etags"].get(str(page))
+            if etag:
+                headers["If-None-Match"] = etag
+            response = self._session.get(
+                url, headers=headers, params={**params, "page": page}
+            )
+            if response.status_code == 304:
+                # 304s carry no Link header, so fall back to the cached
+                # page's emptiness to decide whether to probe further.
+                page_issues = cache["pages"].get(str(page), [])
+                if not page_issues:
+                    break
+                issues.extend(page_issues)
+                continue
+            response.raise_for_status()
+            page_issues = response.json()
+            new_etag = response.headers.get("ETag", "")
+            if new_etag:
+                cache["etags"][str(page)] = new_etag
+                cache["pages"][str(page)] = page_issues
+            issues.extend(page_issues)
+            # The Link header says whether a next page exists, so the last
+            # real page ends the loop without a wasted empty-page request.
+            if not page_issues or "next" not in response.links:
+                break
+        self._save_page_cache(cache)
+        return issues
+
+    def _fetch_initiative_issues_graphql(self) -> list[dict[str, Any]]:
+        """Fetch all initiative issues via cursor-paginated GraphQL.
+
+        Nodes are reshaped to the REST dict layout on the way in, so the
+        downstream parsing pipeline is identical for both transports.
+        """
+        issues: list[dict[str, Any]] = []
+        cursor: str | None = None
+        while True:
+            response = self._session.post(
+                f"{self.api_base}/graphql",
+                json={
+                    "query": _GRAPHQL_QUERY,
+                    "variables": {
+                        "owner": self.org,
+                        "name": self.repo,
+                        "labels": [INITIATIVE_LABEL],
+                        "cursor": cursor,
+                    },
+                },
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get("errors"):
+                raise RuntimeError(f"GraphQL errors: {payload['errors']}")
+            page = payload["data"]["repository"]["issues"]
+            for node in page["nodes"]:
+                issues.append(
+                    {
+                        "number": node["number"],
+                        "title": node.get("title") or "",
+                        "body": node.get("body") or "",
+                        "state": (node.get("state") or "").lower(),
+                        "created_at": node.get("createdAt") or "",
+                        "updated_at": node.get("updatedAt") or "",
+                        "html_url": node.get("url") or "",
+                        "labels": (node.get("labels") or {}).get("nodes", []),
+                    }
+                )
+            if (
+                not page["pageInfo"]["hasNextPage"]
+                or len(issues) >= MAX_PAGES * PER_PAGE
+            ):
+                break
+            cursor = page["pageInfo"]["endCursor"]
+        return issues
+
+    def _fetch_initiative_issues(self) -> list[dict[str, Any]]:
+        try:
+            return self._fetch_initiative_issues_graphql()
+        except (requests.RequestException, RuntimeError, KeyError, TypeError) as exc:
+            # Tokens without GraphQL scope, GHES without the v4 API, schema
+            # drift - all fall back to the REST paths below.
+            print(
+                f"⚠️  GraphQL fetch unavailable ({exc}); falling back to REST",
+                file=sys.stderr,
+            )
+        if aiohttp is None:
+            return self._fetch_initiative_issues_sync()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._fetch_pages_async())
+        # Already inside an event loop (e.g. embedded callers) - stay sync.
+        return self._fetch_initiative_issues_sync()
+
+    # ------------------------------------------------------------------ parse
+
+    @staticmethod
+    def _parse_issue_body(body: str) -> dict[str, str]:
+        """Pull the issue-form fields out of a rendered issue body."""
+        fields: dict[str, str] = {}
+        for match in _BODY_FIELDS_RE.finditer(body):
+            name = _FIELD_CASE.get(match.group("name").lower())
+            if name and name not in fields:
+                fields[name] = _MARKDOWN_BULLET_RE.sub(
+                    "", match.group("content").strip()
+                )
+        return fields
+
+    @staticmethod
+    def _extract_postmortem(text: str) -> tuple[list[str], list[str]]:
+        """Collect root causes and mitigations in one scan of the text."""
+        causes: list[str] = []
+        mitigations: list[str] = []
+        # Three of each is all the lessons schema keeps, so stop scanning
+        # the rest of a long postmortem once both lists are full.
+        for match in _POSTMORTEM_RE.finditer(text):
+            if match.group("cause"):
+                if len(causes) < 3:
+                    causes.append(match.group("ctext").strip())
+            elif len(mitigations) < 3:
+                mitigations.append(match.group("mtext").strip())
+            if len(causes) >= 3 and len(mitigations) >= 3:
+                break
+        return causes, mitigations
+
+    @staticmethod
+    def _extract_risks_from_constraints(constraints: str) -> list[str]:
+        risks: list[str] = []
+        # StringIO yields lines lazily; splitlines would materialise the
+        # whole field as a list first.
+        for line in io.StringIO(constraints):
+            if _RISK_MARKER_RE.search(line.lower()):
+                risks.append(line.strip())
+        return risks
+
+    @staticmethod
+    def _extract_lessons(fields: dict[str, str]) -> dict[str, Any]:
+        # Bind each field once: every .get is a hash probe, and locals hit
+        # LOAD_FAST on every later use.
+        postmortem = fields.get("postmortem", "")
+        constraints = fields.get("constraints", "")
+        scope = fields.get("scope", "")
+        outcome = fields.get("outcomeStatus", "")
+        success = fields.get("successIndicators", "")
+
+        lessons: dict[str, Any] = {
+            "rootCauses": [],
+            "mitigations": [],
+            "risks": [],
+            "outcome": outcome,
+            "successIndicators": [],
+        }
+        if postmortem:
+            causes, mitigations = InitiativeHistoryBuilder._extract_postmortem(
+                postmortem
+            )
+            lessons["rootCauses"] = causes
+            lessons["mitigations"] = mitigations
+        if constraints:
+            lessons["risks"] = InitiativeHistoryBuilder._extract_risks_from_constraints(
+                constraints
+            )
+        if success:
+            lessons["successIndicators"] = [
+                line.strip() for line in io.StringIO(success) if line.strip()
+            ]
+        if scope and not lessons["risks"]:
+            lessons["risks"] = InitiativeHistoryBuilder._extract_risks_from_constraints(
+                scope
+            )
+        return lessons
+
+    @staticmethod
+    def _generate_keywords(
+        title: str, fields: dict[str, str], n: int = 10
+    ) -> list[str]:
+        def candidates():
+            yield fields.get("archetype", "").lower()
+            yield fields.get("domain", "").lower()
+            for text in (title, fields.get("purpose", ""), fields.get("scope", "")):
+                # finditer is lazy, so when the cap below aborts this
+                # generator the rest of a long purpose/scope field is never
+                # tokenised; findall would materialise every word first.
+                for match in _WORD_RE.finditer(text.lower()):
+                    word = match.group()
+                    if word not in _STOP_WORDS:
+                        yield word
+
+        # Ordered dedup with an early exit: once n keywords are collected the
+        # remaining text is never tokenised, and no intermediate lists exist.
+        seen: dict[str, None] = {}
+        for keyword in candidates():
+            if keyword and keyword not in seen:
+                # The same keywords recur across most initiatives; interning
+                # shares one string object per keyword across the whole index
+                # and turns later hash probes into pointer comparisons.
+                seen[sys.intern(keyword)] = None
+                if len(seen) >= n:
+                    break
+        return list(seen)
+
+    @staticmethod
+    def _process_initiative(issue: dict[str, Any]) -> dict[str, Any] | None:
+        title = issue.get("title", "")
+        name_match = _INITIATIVE_TITLE_RE.search(title)
+        name = name_match.group(1).strip() if name_match else title.strip()
+        fields = InitiativeHistoryBuilder._parse_issue_body(issue.get("body") or "")
+        archetype = fields.get("archetype", "")
+        domain = fields.get("domain", "")
+        outcome_status = fields.get("outcomeStatus")
+        return {
+            "initiative": name,
+            "issueNumber": issue.get("number"),
+            # Status mapping inlined: one hash probe, no extra call frame per issue.
+            "status": outcome_status
+            or _DEFAULT_STATUS.get(issue.get("state", ""), "completed"),
+            "archetype": archetype,
+            "domain": domain,
+            "keywords": InitiativeHistoryBuilder._generate_keywords(title, fields),
+            "lessons": InitiativeHistoryBuilder._extract_lessons(fields),
+            "createdAt": issue.get("created_at", ""),
+            "updatedAt": issue.get("updated_at", ""),
+            "url": issue.get("html_url", ""),
+        }
+
+    # ------------------------------------------------------------------ build
+
+    def build_history(self, output_file: Path) -> int:
+        issues = self._fetch_initiative_issues()
+        if self._verify_labels:
+            issues = [
+                issue
+                for issue in issues
+                if any(
+                    label.get("name") == INITIATIVE_LABEL
+                    for label in issue.get("labels", ())
+                )
+            ]
+        initiatives = [issue for issue in issues if "pull_request" not in issue]
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        # Entries stream straight to the (1 MiB buffered) handle as they are
+        # produced, so peak memory is one entry rather than the whole index
+        # plus its serialised form.
+        with open(output_file, "wb", buffering=1 << 20) as f:
+            if len(initiatives) >= PARALLEL_THRESHOLD:
+                # Parsing is CPU-bound regex work and independent per issue,
+                # so fan out across cores. The helpers are staticmethods
+                # (picklable) and the patterns are module-level, so workers
+                # compile nothing; pool.map yields in order as chunks finish.
+                with concurrent.futures.ProcessPoolExecutor() as pool:
+                    for entry, error in pool.map(
+                        _process_initiative_safe, initiatives, chunksize=16
+                    ):
+                        if error:
+                            print(f"⚠️  Skipping issue {error}", file=sys.stderr)
+                            continue
+                        if entry:
+                            f.write(_dumps(entry) + b"\n")
+                            count += 1
+            else:
+                # One bound-method lookup for the whole loop rather than an
+                # attribute probe per issue.
+                process = self._process_initiative
+                for issue in initiatives:
+                    try:
+                        entry = process(issue)
+                    except Exception as exc:  # noqa: BLE001 - one bad issue must not sink the build
+                        print(
+                            f"⚠️  Skipping issue #{issue.get('number')}: {exc}",
+                            file=sys.stderr,
+                        )
+                        continue
+                    if entry:
+                        f.write(_dumps(entry) + b"\n")
+                        count += 1
+        return count
+
+
+def _process_initiative_safe(
+    issue: dict[str, Any],
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Worker-side wrapper so one bad issue cannot sink the pooled build.
+
+    Returns ``(entry, None)`` on success and ``(None, reason)`` on failure;
+    the parent process reports the reason, matching the serial branch's
+    skip-and-warn policy.
+    """
+    try:
+        return InitiativeHistoryBuilder._process_initiative(issue), None
+    except Exception as exc:  # noqa: BLE001 - mirrors the serial branch's guard
+        return None, f"#{issue.get('number')}: {exc}"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Build the initiative history JSONL index"
+    )
+    parser.add_argument(
+        "--org", default=os.environ.get("GITHUB_ORG", "SPECTRADataSolutions")
+    )
+    parser.add_argument("--repo", default=os.environ.get("GITHUB_REPO", ".github"))
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("GITHUB_TOKEN"),
+        help="GitHub token (env: GITHUB_TOKEN)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=_DEFAULT_OUTPUT,
+        help=f"Output JSONL path (default: {_DEFAULT_OUTPUT})",
+    )
+    parser.add_argument("--api", default=_DEFAULT_API, help="GitHub API base URL")
+    parser.add_argument(
+        "--verify-labels",
+        action="store_true",
+        help="Re-check the type:initiative label client-side (defensive; off by default)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    if not args.token:
+        raise SystemExit("Missing --token (or GITHUB_TOKEN)")
+    builder = InitiativeHistoryBuilder(
+        args.org, args.repo, args.token, args.api, verify_labels=args.verify_labels
+    )
+    count = builder.build_history(args.output)
+    print(f"📚 Wrote {count} initiative entries to {args.output}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
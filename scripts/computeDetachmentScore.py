@@ -0,0 +1,351 @@
+"""Score how cleanly the server subsystem could be extracted from this repo.
+
+Walks the context folders looking for coupling signals - upward relative
+imports, hardcoded ``SPECTRADataSolutions/.github`` references, undocumented
+API boundaries, configuration that leans on this repo - and distils them
+into a 0-100 detachment score. The report is printed and persisted to
+``detachment-score.json`` so CI and the migration checklist can track
+extraction readiness over time.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+try:  # orjson serialises several times faster; stdlib json remains a full fallback.
+    import orjson
+
+    def _dumps_indent(obj: dict) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+
+    def _dumps_indent(obj: dict) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Folders that would move (or be mirrored) when the server is extracted.
+CONTEXT_FOLDERS = ("scripts", "workflows", "config", "docs")
+SOURCE_SUFFIXES = (".py", ".js", ".yml", ".yaml", ".md", ".json")
+# Pruned at scandir level, so these subtrees are never even entered.
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "node_modules",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".tox",
+        "__pycache__",
+    }
+)
+
+# Compiled once: both patterns run against every scanned file.
+# Bytes-mode patterns: every coupling signal is plain ASCII, so matching the
+# raw buffer (read or mmapped) is equivalent and skips decoding altogether.
+_UPWARD_IMPORT_RE = re.compile(rb"^\s*(?:from|import)\s+\.\.", re.MULTILINE)
+_HARDCODED_GITHUB_RE = re.compile(rb"SPECTRADataSolutions/\.github")
+_ENDPOINT_RE = re.compile(rb"\b(?:GET|POST|PUT|DELETE)\s+/\w+", re.IGNORECASE)
+# Files at or above this size are mmapped so the regex engine scans the page
+# cache directly instead of a heap copy.
+_MMAP_THRESHOLD = 1 << 16
+# Anything beyond this is generated output (lockfiles, exported JSON), not
+# human-authored docs or code, and is not worth scanning for coupling.
+_MAX_SCAN_SIZE = 2_000_000
+
+
+@lru_cache(maxsize=1024)
+def _read_bytes(path: str) -> bytes:
+    """Read a file once per run; fixed-path checks (READMEs, config files)
+    can land on the same file more than once and should not re-hit disk."""
+    try:
+        return Path(path).read_bytes()
+    except OSError:
+        return b""
+
+
+def _iter_source_files(
+    root: Path, suffixes: tuple[str, ...], skip_dirs: frozenset[str]
+) -> Iterator[str]:
+    """Yield matching file paths via an os.scandir walk.
+
+    DirEntry answers is_dir/is_file from the dirent itself, so unlike
+    Path.rglob there is no extra stat() per entry and no PurePath object
+    built for files the suffix filter rejects. Skipped directories are
+    pruned before descent, so their subtrees are never walked at all.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith(
+                    suffixes
+                ):
+                    yield entry.path
+
+
+class DetachmentScoreCalculator:
+    """Accumulates bonus/deduction factors and renders the final report."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = root or Path.cwd()
+        self.server_path = self.root / "server"
+        self._factors: list[tuple[str, int]] = []
+
+    # ------------------------------------------------------------------ checks
+
+    @staticmethod
+    def _import_factor(rel: str, buf: bytes | mmap.mmap) -> tuple[str, int] | None:
+        """Pure per-file check: upward relative imports in Python sources."""
+        if not rel.endswith(".py"):
+            return None
+        # Cheap memchr-backed probe deciding whether the regex can possibly
+        # hit before the full scan is paid for. A pre-filter must accept a
+        # superset of the pattern, and the regex tolerates any whitespace
+        # between the keyword and the dots, so the only safe literal is the
+        # ".." itself.
+        if buf.find(b"..") == -1:
+            return None
+        if _UPWARD_IMPORT_RE.search(buf):
+            return (f"Upward relative import in {rel}", -3)
+        return None
+
+    @staticmethod
+    def _hardcoded_factor(rel: str, buf: bytes | mmap.mmap) -> tuple[str, int] | None:
+        """Pure per-file check: hardcoded references to this repo."""
+        if buf.find(b"SPECTRADataSolutions") == -1:
+            return None
+        # The reference is a plain literal: bytes.count runs at memmem speed
+        # with no match-object allocation; mmap lacks count, so counting
+        # there goes through finditer without materialising a list.
+        if isinstance(buf, bytes):
+            occurrences = buf.count(b"SPECTRADataSolutions/.github")
+        else:
+            occurrences = sum(1 for _ in _HARDCODED_GITHUB_RE.finditer(buf))
+        if occurrences:
+            return (f"Hardcoded .github reference in {rel} ({occurrences}x)", -2)
+        return None
+
+    _FILE_CHECKS = (_import_factor, _hardcoded_factor)
+
+    def _walk_and_analyze(self) -> list[tuple[str, int]]:
+        """Walk the context folders exactly once, reading each file once and
+        dispatching every per-file check off the same buffer."""
+        factors: list[tuple[str, int]] = []
+        for folder in CONTEXT_FOLDERS:
+            folder_path = self.root / folder
+            if not folder_path.exists():
+                continue
+            for file_path in _iter_source_files(
+                folder_path, SOURCE_SUFFIXES, SKIP_DIRS
+            ):
+                buf: bytes | mmap.mmap
+                try:
+                    with open(file_path, "rb") as fh:
+                        size = os.fstat(fh.fileno()).st_size
+                        if size > _MAX_SCAN_SIZE:
+                            continue
+                        if size >= _MMAP_THRESHOLD:
+                            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                        else:
+                            buf = fh.read()
+                except (OSError, ValueError):
+                    continue
+                try:
+                    rel = os.path.relpath(file_path, self.root)
+                    for check in self._FILE_CHECKS:
+                        factor = check.__func__(rel, buf)
+                        if factor:
+                            factors.append(factor)
+                finally:
+                    if isinstance(buf, mmap.mmap):
+                        buf.close()
+        return factors
+
+    def _check_api_boundaries(self) -> list[tuple[str, int]]:
+        """API surface must be documented before extraction makes sense."""
+        candidates = (self.server_path / "README.md", self.root / "README.md")
+        for readme in candidates:
+            if not readme.exists():
+                continue
+            try:
+                with (
+                    open(readme, "rb") as fh,
+                    mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                ):
+                    # One alternation pass over the page cache, zero-copy.
+                    endpoint_count = sum(1 for _ in _ENDPOINT_RE.finditer(mm))
+            except (OSError, ValueError):  # ValueError: empty file cannot be mapped
+                continue
+            if endpoint_count >= 3:
+                return [("API boundaries documented", 3)]
+        return [("Fewer than 3 documented API endpoints", -5)]
+
+    def _check_configuration_independence(self) -> list[tuple[str, int]]:
+        config_path = self.root / "config"
+        # Config lives flat in config/, so a single scandir pass (one
+        # getdents per directory, no Path allocation per entry) replaces the
+        # recursive rglob machinery.
+        try:
+            entries = os.scandir(config_path)
+        except OSError:
+            return []
+        with entries:
+            tainted = [
+                entry.name
+                for entry in entries
+                if entry.is_file()
+                and entry.name.endswith(".yml")
+                and _HARDCODED_GITHUB_RE.search(_read_bytes(entry.path))
+            ]
+        if tainted:
+            return [
+                (f"Configuration references this repo: config/{name}", -2)
+                for name in tainted
+            ]
+        return [("Configuration is self-contained", 2)]
+
+    def _check_server_isolation(self) -> list[tuple[str, int]]:
+        if not self.server_path.exists():
+            return [("Server directory does not exist yet", 5)]
+        factors: list[tuple[str, int]] = []
+        # Both candidate locations are probed explicitly; the old `or` chain
+        # always short-circuited on the first (truthy) Path and never looked
+        # at the placeholder fallback.
+        server_dir = str(self.server_path)
+        for candidate in ("README.md", os.path.join("placeholder", "README.md")):
+            if os.path.isfile(os.path.join(server_dir, candidate)):
+                break
+        else:
+            factors.append(("Server directory is missing a README", -4))
+        with os.scandir(self.server_path) as entries:
+            stray_count = sum(
+                1
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".yml")
+            )
+        if stray_count:
+            factors.append(
+                (f"Server directory carries {stray_count} workflow config file(s)", -2)
+            )
+        return factors
+
+    # ------------------------------------------------------------------ report
+
+    def _generate_report(self, final_score: int) -> dict:
+        # One pass over the factors instead of four comprehensions/sums.
+        positives: list[str] = []
+        negatives: list[str] = []
+        total_bonuses = 0
+        total_deductions = 0
+        # Deltas are tracked numerically at insertion; the "(+N)" suffix is
+        # purely presentation and is rendered here, once, at report time.
+        for desc, delta in self._factors:
+            if delta > 0:
+                positives.append(f"{desc} (+{delta})")
+                total_bonuses += delta
+            else:
+                negatives.append(desc)
+                total_deductions -= delta
+
+        if final_score >= 90:
+            status = "🌟 EXCELLENT - Ready for extraction"
+            recommendation = (
+                "System is ready for extraction. Proceed with migration checklist."
+            )
+        elif final_score >= 70:
+            status = "✅ GOOD - Minor coupling remains"
+            recommendation = (
+                "Address the listed deductions, then re-run before extracting."
+            )
+        elif final_score >= 50:
+            status = "⚠️ FAIR - Noticeable coupling"
+            recommendation = "Decouple the flagged files before planning extraction."
+        else:
+            status = "🛑 POOR - Tightly coupled"
+            recommendation = (
+                "Extraction is premature; start with the largest deductions."
+            )
+
+        result = {
+            "detachmentScore": final_score,
+            "status": status,
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "bonuses": positives,
+            "deductions": negatives,
+            "recommendation": recommendation,
+        }
+        # Serialise in memory and emit in one write; json.dump would issue a
+        # small write() per token through the file protocol.
+        report_path = self.root / "detachment-score.json"
+        report_path.write_text(_dumps_indent(result), encoding="utf-8")
+
+        # One stdout write for the whole report: each print would take the
+        # stdout lock and flush separately, which CI log capture amplifies.
+        lines = [
+            "",
+            "=" * 50,
+            f"🎯 Final Detachment Score: {final_score}/100",
+            f"   Status: {status}",
+            "=" * 50,
+        ]
+        if positives:
+            lines.append("")
+            lines.append(f"Bonuses (+{total_bonuses}):")
+            lines.extend(f"  + {desc}" for desc in positives)
+        if negatives:
+            lines.append("")
+            lines.append(f"Deductions (-{total_deductions}):")
+            lines.extend(f"  - {desc}" for desc in negatives)
+        lines.append("")
+        lines.append(f"Recommendation: {recommendation}")
+        lines.append(f"Report written to {report_path}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return result
+
+    def calculate_score(self) -> int:
+        sys.stdout.write(f"🔍 Computing detachment score...\n   Root: {self.root}\n\n")
+        # The checks are read-only and disk-bound over disjoint subtrees, so
+        # overlap their I/O with threads (the GIL is released during reads).
+        # Each returns its own factor list; merging in declaration order
+        # afterwards keeps the report deterministic.
+        checks = (
+            self._check_api_boundaries,
+            self._walk_and_analyze,
+            self._check_configuration_independence,
+            self._check_server_isolation,
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for factors in executor.map(lambda check: check(), checks):
+                self._factors.extend(factors)
+        final_score = max(0, min(100, 100 + sum(delta for _, delta in self._factors)))
+        self._generate_report(final_score)
+        _read_bytes.cache_clear()
+        return final_score
+
+
+def main() -> None:
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
+    score = DetachmentScoreCalculator(root).calculate_score()
+    sys.exit(0 if score >= 70 else 1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
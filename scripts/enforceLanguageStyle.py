@@ -0,0 +1,227 @@
+"""Enforce SPECTRA language style across repository text.
+
+Flags lazy abbreviations ("org", "dept", "info") that should be written
+out in full per the organisation's British-English documentation policy,
+and is the place to guard similar habits as they appear. URLs, ``.org``
+domains and quoted literals are exempt because they usually name real
+identifiers rather than prose.
+
+Run from the repo root; exits non-zero when violations are found so CI
+can gate on it.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import re
+import sys
+from collections.abc import Iterator
+
+logger = logging.getLogger("enforceLanguageStyle")
+
+SCAN_SUFFIXES = (".md", ".txt", ".py", ".yml", ".yaml")
+# Pruned at scandir level, so these subtrees are never even entered.
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "node_modules",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".tox",
+        "__pycache__",
+    }
+)
+# Batch size for fanning the scan out across worker processes.
+CHUNK_SIZE = 64
+
+# Compiled once at module scope: the scan runs these over every line of every
+# file, so per-call re.search would be dominated by pattern-cache lookups.
+# One alternation with named groups replaces three separate passes per line.
+BANNED_RE = re.compile(
+    r"\b(?P<org>org)\b|\b(?P<dept>dept)\b|\b(?P<info>info)\b", re.IGNORECASE
+)
+URL_RE = re.compile(r"https?://", re.IGNORECASE)
+DOT_ORG_RE = re.compile(r"\.org\b", re.IGNORECASE)
+PREFERRED = {"org": "organisation", "dept": "department", "info": "information"}
+# Byte-level tokens for the pre-decode fast path, plus an ASCII lowercase
+# translation table so one translate() covers every case variant.
+_BANNED_TOKENS = (b"org", b"dept", b"info")
+_UPPER_TO_LOWER = bytes.maketrans(
+    bytes(range(ord("A"), ord("Z") + 1)), bytes(range(ord("a"), ord("z") + 1))
+)
+
+try:  # Aho-Corasick scans in O(n) regardless of how far the banned list grows.
+    import ahocorasick
+
+    _AUTOMATON = ahocorasick.Automaton()
+    for _word in PREFERRED:
+        _AUTOMATON.add_word(_word, _word)
+    _AUTOMATON.make_automaton()
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _AUTOMATON = None
+
+
+def _iterMatches(text: str) -> Iterator[tuple[int, int, str]]:
+    """Yield (start, end, key) for every banned-word hit in ``text``.
+
+    Uses the C-backed automaton when pyahocorasick is installed - one pass
+    whatever the dictionary size, with word boundaries validated here since
+    the automaton matches raw substrings - and falls back to the compiled
+    alternation otherwise.
+    """
+    if _AUTOMATON is None:
+        for match in BANNED_RE.finditer(text):
+            yield match.start(), match.end(), match.lastgroup
+        return
+    lowered = text.lower()
+    textLength = len(text)
+    for endIndex, key in _AUTOMATON.iter(lowered):
+        start = endIndex - len(key) + 1
+        if start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+            continue
+        if endIndex + 1 < textLength and (
+            text[endIndex + 1].isalnum() or text[endIndex + 1] == "_"
+        ):
+            continue
+        yield start, endIndex + 1, key
+
+
+def initialiseLogger() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def _iter_files(
+    root: str, suffixes: tuple[str, ...], skip_dirs: frozenset[str]
+) -> Iterator[str]:
+    """os.scandir walk that prunes skipped directories before descending.
+
+    DirEntry answers is_dir/is_file from cached dirent data, so unlike
+    Path.rglob nothing here pays an extra stat or builds a Path object,
+    and pruned subtrees (node_modules and friends) are never entered.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith(
+                    suffixes
+                ):
+                    yield entry.path
+
+
+def loadRepositoryFiles(root: str) -> list[str]:
+    """Collect the text files worth scanning, as plain string paths."""
+    return list(_iter_files(root, SCAN_SUFFIXES, SKIP_DIRS))
+
+
+def _scanChunk(paths: list[str]) -> list[tuple[str, int, str, str, str]]:
+    """Scan one batch of files; runs in worker processes for large repos."""
+    violations: list[tuple[str, int, str, str, str]] = []
+    for path in paths:
+        try:
+            with open(path, "rb") as fh:
+                raw = fh.read()
+        except OSError:
+            continue
+        # Most files contain no candidate at all; memchr-speed substring
+        # probes over the lowercased bytes decide that without running the
+        # decoder or the regex engine at all.
+        rawLower = raw.translate(_UPPER_TO_LOWER)
+        if not any(token in rawLower for token in _BANNED_TOKENS):
+            continue
+        # Tolerant decode: a stray invalid byte should not exempt the rest
+        # of an otherwise scannable file.
+        text = raw.decode("utf-8", "ignore")
+        if _AUTOMATON is None and not BANNED_RE.search(text):
+            continue
+        # One sweep over the whole file instead of a regex call per line.
+        # Line numbers come from counting newlines between consecutive
+        # matches, so the file's newlines are counted once overall.
+        lineNumber = 1
+        countedTo = 0
+        cachedLineStart = -1
+        lineExempt = False
+        for start, end, key in _iterMatches(text):
+            lineNumber += text.count("\n", countedTo, start)
+            countedTo = start
+            lineStart = text.rfind("\n", 0, start) + 1
+            lineEnd = text.find("\n", end)
+            if lineEnd < 0:
+                lineEnd = len(text)
+            line = text[lineStart:lineEnd]
+            # The URL/.org exemption is a property of the line, so evaluate
+            # it once per line rather than once per match on that line.
+            if lineStart != cachedLineStart:
+                cachedLineStart = lineStart
+                lineExempt = bool(URL_RE.search(line) or DOT_ORG_RE.search(line))
+            if lineExempt:
+                continue
+            # Skip matches inside quoted literals (odd quote count before
+            # and after the match means we are inside a string). Counting
+            # with explicit bounds on the full text avoids the substring
+            # copies (and their O(line) cost per match) the slices made.
+            quotesBefore = text.count('"', lineStart, start) + text.count(
+                "'", lineStart, start
+            )
+            quotesAfter = text.count('"', end, lineEnd) + text.count("'", end, lineEnd)
+            if quotesBefore % 2 == 1 and quotesAfter % 2 == 1:
+                continue
+            violations.append(
+                (path, lineNumber, text[start:end], PREFERRED[key], line.strip())
+            )
+    return violations
+
+
+def scanRepositoryText(files: list[str]) -> list[tuple[str, int, str, str, str]]:
+    """Scan files for banned abbreviations.
+
+    Returns (path, lineNumber, word, preferred, line) tuples. Large file
+    sets fan out across worker processes in batches of 64 paths; the scan
+    is bounded by read() syscalls plus regex CPU, both of which scale
+    near-linearly with cores. The patterns are module-level, so each
+    worker compiles them once at import.
+    """
+    if len(files) < 2 * CHUNK_SIZE:
+        return _scanChunk(files)
+    chunks = [files[i : i + CHUNK_SIZE] for i in range(0, len(files), CHUNK_SIZE)]
+    violations: list[tuple[str, int, str, str, str]] = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for part in executor.map(_scanChunk, chunks, chunksize=4):
+            violations.extend(part)
+    return violations
+
+
+def reportViolations(violations: list[tuple[str, int, str, str, str]]) -> None:
+    if not violations:
+        logger.info("✅ Language style clean: no banned abbreviations found.")
+        return
+    logger.info("❌ %d language-style violation(s):", len(violations))
+    for path, lineNumber, word, preferred, line in violations:
+        logger.info(
+            '  %s:%d  "%s" → use "%s"  |  %s', path, lineNumber, word, preferred, line
+        )
+
+
+def main() -> int:
+    root = sys.argv[1] if len(sys.argv) > 1 else "."
+    files = loadRepositoryFiles(root)
+    violations = scanRepositoryText(files)
+    reportViolations(violations)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    initialiseLogger()
+    sys.exit(main())
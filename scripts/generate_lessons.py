@@ -0,0 +1,697 @@
+"""Generate lessons-learned guidance for a new initiative.
+
+Reads the JSONL history index written by ``scripts/build_history.py``,
+scores past initiatives against the proposed one with TF-IDF cosine
+similarity (plus small archetype/domain boosts), and consolidates the
+lessons attached to the closest matches into a single advisory document
+the intake workflow can post back on the issue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import concurrent.futures
+import heapq
+import json
+import math
+import mmap
+import operator
+import os
+import pickle
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:  # orjson parses JSONL several times faster; stdlib json remains a fallback.
+    from orjson import loads as _loads
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _loads = json.loads
+
+try:  # numpy underpins both optional fast paths below.
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    np = None
+
+try:  # scipy turns the similarity scan into one sparse matvec; optional.
+    from scipy.sparse import csr_matrix
+
+    _HAVE_SPARSE = np is not None
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _HAVE_SPARSE = False
+
+try:  # torch moves the bulk cosine to the GPU for large histories; optional.
+    import torch
+
+    _HAVE_TORCH = np is not None
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _HAVE_TORCH = False
+
+try:  # numba compiles the pairwise cosine when scipy is absent; optional.
+    import numba
+
+    _HAVE_NUMBA = np is not None
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _HAVE_NUMBA = False
+
+if _HAVE_NUMBA:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _dot_sorted_nb(idx1, val1, idx2, val2):  # pragma: no cover - compiled
+        """Two-pointer merge dot product over sorted int32 id arrays.
+
+        No dict hashing, no boxing: the whole intersection runs as
+        machine code over four flat arrays.
+        """
+        i = 0
+        j = 0
+        dot = 0.0
+        while i < idx1.size and j < idx2.size:
+            a = idx1[i]
+            b = idx2[j]
+            if a == b:
+                dot += val1[i] * val2[j]
+                i += 1
+                j += 1
+            elif a < b:
+                i += 1
+            else:
+                j += 1
+        return dot
+
+
+def _vectorize_chunk(payload):
+    """Vectorise one batch of token lists; runs in worker processes.
+
+    Takes (token lists, idf column, token ids) as a single payload so
+    the pool can ship each chunk with one pickle round-trip.
+    """
+    tokens_chunk, idf_vec, token_id = payload
+    columns = InitiativeLessonsGenerator._vector_columns
+    return [columns(tokens, idf_vec, token_id) for tokens in tokens_chunk]
+
+
+_DEFAULT_HISTORY = Path(".spectra/history/initiatives.jsonl")
+_DEFAULT_OUTPUT = Path("lessons-learned.json")
+
+# Maximal alphabetic runs are self-delimiting, so the \b anchors the old
+# pattern carried only cost two zero-width checks per match. The bound
+# findall skips the attribute dispatch on every tokenise call.
+RE_WORD = re.compile(r"[a-zA-Z]{3,}")
+_findall_words = RE_WORD.findall
+STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "from",
+        "that",
+        "this",
+        "are",
+        "was",
+        "were",
+        "will",
+        "shall",
+        "has",
+        "have",
+        "had",
+        "its",
+        "not",
+        "but",
+        "can",
+        "all",
+        "any",
+        "per",
+        "via",
+        "into",
+        "out",
+        "our",
+        "their",
+    }
+)
+
+# Entries scoring below the floor share too little with the query to teach
+# anything; boosts reward matching archetype/domain beyond pure text overlap.
+SIMILARITY_FLOOR = 0.1
+MAX_SIMILAR = 5
+ARCHETYPE_BOOST = 0.15
+DOMAIN_BOOST = 0.1
+
+# Densifying the matrix for the GPU only pays off while it still fits
+# comfortably in device memory (elements, fp16).
+_DENSE_LIMIT = 32_000_000
+
+# Below this many entries the fork/pickle overhead of a process pool
+# outweighs the vectorising work itself.
+PARALLEL_THRESHOLD = 512
+_CHUNK_SIZE = 128
+
+# Lesson categories carried over from the history index, in report order.
+_LESSON_CATEGORIES = ("rootCauses", "mitigations", "risks", "successIndicators")
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """One vectorised initiative from the history index."""
+
+    initiative: str
+    archetype: str
+    domain: str
+    lessons: dict[str, Any]
+    url: str
+    ids: Any = None
+    vals: Any = None
+    max_val: float = 0.0
+
+
+class InitiativeLessonsGenerator:
+    """Scores history entries against a proposed initiative and merges
+    the lessons of the closest matches."""
+
+    def __init__(self, history_path: Path = _DEFAULT_HISTORY) -> None:
+        self.history_path = history_path
+        self.history: list[HistoryEntry] = []
+        self.vocabulary: set[str] = set()
+        self._matrix = None
+        self._dense = None
+        self._vocab_sorted = None
+        self._idf_vec = None
+        self._token_id: dict[str, int] = {}
+        self._postings: dict[int, list[int]] = {}
+
+    # ------------------------------------------------------------------ load
+
+    def _load_history(self) -> None:
+        try:
+            stat = os.stat(self.history_path)
+        except OSError:
+            return
+        # The vectorised index is deterministic for a given JSONL file and
+        # accelerator configuration, so a sidecar keyed on mtime+size plus
+        # which optional libraries are present turns repeat invocations into
+        # one unpickle instead of a full re-parse and re-vectorise. The
+        # library part matters: a sidecar written with numpy/scipy installed
+        # holds array types a stripped-down environment cannot unpickle.
+        signature = (
+            f"{stat.st_mtime_ns}-{stat.st_size}"
+            f"-np{int(np is not None)}-sp{int(_HAVE_SPARSE)}-nb{int(_HAVE_NUMBA)}"
+        )
+        cache_path = self.history_path.with_suffix(".idx.pkl")
+        if self._load_cached_index(cache_path, signature):
+            return
+        # Parse straight off the mapped file: no per-line str decode, no
+        # read() copy, and orjson (when installed) on the raw bytes.
+        # Stream the parse: each raw dict is reduced to the fields the
+        # entry needs plus its token list (composed and tokenised exactly
+        # once) and then dropped, so memory holds trimmed records rather
+        # than every parsed JSON object.
+        records: list[tuple[str, str, str, dict[str, Any], str]] = []
+        tokens_per_entry: list[list[str]] = []
+        try:
+            with (
+                open(self.history_path, "rb") as fh,
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                while True:
+                    line = mm.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    obj = _loads(line)
+                    records.append(
+                        (
+                            obj.get("initiative", ""),
+                            obj.get("archetype", ""),
+                            obj.get("domain", ""),
+                            obj.get("lessons", {}),
+                            obj.get("url", ""),
+                        )
+                    )
+                    tokens_per_entry.append(
+                        self._tokenize(self._compose_text_from_history(obj))
+                    )
+        except (OSError, ValueError):  # ValueError: empty file cannot be mapped
+            return
+
+        for tokens in tokens_per_entry:
+            self.vocabulary.update(tokens)
+        self._compute_idf(tokens_per_entry)
+
+        # The bulk path vectorises straight into the CSR arrays; the other
+        # tiers build the structure-of-arrays columns (fanned out across
+        # worker processes for large corpora).
+        columns = None if _HAVE_SPARSE else self._vectorize_entries(tokens_per_entry)
+        for doc_id, (initiative, archetype, domain, lessons, url) in enumerate(records):
+            entry = HistoryEntry(
+                initiative=initiative,
+                archetype=archetype,
+                domain=domain,
+                lessons=lessons,
+                url=url,
+            )
+            if columns is not None:
+                entry.ids, entry.vals, entry.max_val = columns[doc_id]
+                if not _HAVE_NUMBA:
+                    # Inverted index for the pure tier: the scorer walks
+                    # only the postings of tokens the query contains, so
+                    # entries sharing no term with the query cost nothing.
+                    for token_id in entry.ids:
+                        self._postings.setdefault(token_id, []).append(doc_id)
+            self.history.append(entry)
+        if _HAVE_SPARSE:
+            self._build_matrix(tokens_per_entry)
+        self._save_index(cache_path, signature)
+
+    def _load_cached_index(self, cache_path: Path, signature: str) -> bool:
+        # The sidecar is purely an optimisation, so any trouble with it -
+        # missing file, truncated pickle, a payload shape from an older
+        # version (KeyError), or arrays pickled under libraries that are
+        # no longer installed (ModuleNotFoundError) - falls through to a
+        # full re-parse rather than failing the run.
+        try:
+            with open(cache_path, "rb") as fh:
+                payload = pickle.load(fh)
+            if payload.get("signature") != signature:
+                return False
+            history = payload["history"]
+            vocabulary = payload["vocabulary"]
+            token_id = payload["token_id"]
+            idf_vec = payload["idf_vec"]
+            postings = payload["postings"]
+            matrix = payload["matrix"]
+            vocab_sorted = payload["vocab_sorted"]
+        except Exception:  # noqa: BLE001 - any bad sidecar just means a re-parse
+            return False
+        self.history = history
+        self.vocabulary = vocabulary
+        self._token_id = token_id
+        self._idf_vec = idf_vec
+        self._postings = postings
+        self._matrix = matrix
+        self._dense = None
+        self._vocab_sorted = vocab_sorted
+        return True
+
+    def _save_index(self, cache_path: Path, signature: str) -> None:
+        payload = {
+            "signature": signature,
+            "history": self.history,
+            "vocabulary": self.vocabulary,
+            "token_id": self._token_id,
+            "idf_vec": self._idf_vec,
+            "postings": self._postings,
+            "matrix": self._matrix,
+            "vocab_sorted": self._vocab_sorted,
+        }
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:  # a read-only checkout just skips the cache
+            pass
+
+    def _vectorize_entries(self, tokens_per_entry: list[list[str]]):
+        """Produce (ids, vals, max_val) columns for every entry, using a
+        process pool past the threshold - the work is per-entry pure
+        compute, so it scales with cores like the history builder's
+        issue parsing does."""
+        if len(tokens_per_entry) < PARALLEL_THRESHOLD:
+            return _vectorize_chunk((tokens_per_entry, self._idf_vec, self._token_id))
+        chunks = [
+            (tokens_per_entry[i : i + _CHUNK_SIZE], self._idf_vec, self._token_id)
+            for i in range(0, len(tokens_per_entry), _CHUNK_SIZE)
+        ]
+        columns: list[tuple[Any, Any, float]] = []
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            for part in executor.map(_vectorize_chunk, chunks):
+                columns.extend(part)
+        return columns
+
+    @staticmethod
+    def _flatten_lessons(lessons: dict[str, Any]) -> list[str]:
+        """Collect the string leaves of a lessons dict.
+
+        Serialising the dict with json.dumps polluted the vocabulary with
+        structural artefacts (key names, "true", brackets-adjacent runs)
+        and inflated document frequencies; only the prose matters.
+        """
+        leaves: list[str] = []
+        for value in lessons.values():
+            if isinstance(value, str):
+                leaves.append(value)
+            elif isinstance(value, list):
+                leaves.extend(item for item in value if isinstance(item, str))
+        return leaves
+
+    @staticmethod
+    def _compose_text_from_history(obj: dict[str, Any]) -> str:
+        return " ".join(
+            (
+                obj.get("initiative", ""),
+                obj.get("archetype", ""),
+                obj.get("domain", ""),
+                " ".join(obj.get("keywords", [])),
+                " ".join(
+                    InitiativeLessonsGenerator._flatten_lessons(obj.get("lessons", {}))
+                ),
+            )
+        )
+
+    @staticmethod
+    def _tokenize(text: str) -> list[str]:
+        return [word for word in _findall_words(text.lower()) if word not in STOP_WORDS]
+
+    def _compute_idf(self, tokens_per_entry: list[list[str]]) -> None:
+        total = len(tokens_per_entry)
+        if not total:
+            return
+        # Counter.update with a set bumps every distinct token in one
+        # C-level call, replacing a Python-level probe per token.
+        df: Counter[str] = Counter()
+        for tokens in tokens_per_entry:
+            df.update(set(tokens))
+        # IDF lives in a flat float32 column indexed by token id: direct
+        # subscripting in the hot path instead of hashing a str per term,
+        # and a fraction of a dict's memory. The str-keyed form exists
+        # only transiently here.
+        words = sorted(df)
+        self._token_id = {word: i for i, word in enumerate(words)}
+        idf = [math.log(total / (1 + df[word])) + 1.0 for word in words]
+        if np is not None:
+            self._idf_vec = np.array(idf, dtype=np.float32)
+        else:
+            self._idf_vec = array.array("f", idf)
+        if _HAVE_SPARSE:
+            # Sorted vocabulary array lets the numpy vectoriser resolve
+            # token ids with one searchsorted call.
+            self._vocab_sorted = np.array(words)
+
+    @staticmethod
+    def _vector_columns(tokens: list[str], idf_vec, token_id: dict[str, int]):
+        """Count, weight and L2-normalise one entry straight into sorted
+        id/value columns - no intermediate str-keyed vector at all."""
+        counts: dict[int, int] = {}
+        get_id = token_id.get
+        for token in tokens:
+            tid = get_id(token)
+            if tid is not None:
+                counts[tid] = counts.get(tid, 0) + 1
+        if not counts:
+            if np is not None:
+                return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32), 0.0
+            return array.array("l"), array.array("f"), 0.0
+        length = len(tokens)
+        pairs = sorted(counts.items())
+        weights = [(count / length) * idf_vec[tid] for tid, count in pairs]
+        norm = math.sqrt(sum(w * w for w in weights))
+        if norm:
+            weights = [w / norm for w in weights]
+        if np is not None:
+            ids = np.fromiter(
+                (tid for tid, _ in pairs), dtype=np.int32, count=len(pairs)
+            )
+            vals = np.asarray(weights, dtype=np.float32)
+        else:
+            ids = array.array("l", (tid for tid, _ in pairs))
+            vals = array.array("f", weights)
+        return ids, vals, max(weights)
+
+    # ------------------------------------------------------------------ score
+
+    def _vectorize_np(self, tokens: list[str]):
+        """Weight a pre-tokenised entry entirely in NumPy.
+
+        Unique counting and vocabulary lookup run as C-level array ops
+        (stop words are already filtered by _tokenize); the returned
+        (sorted ids, tf-idf weights) pair drops straight into CSR
+        assembly.
+        """
+        if not tokens or not len(self._vocab_sorted):
+            return (
+                np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.float32),
+            )
+        arr = np.array(tokens)
+        uniq, counts = np.unique(arr, return_counts=True)
+        pos = np.searchsorted(self._vocab_sorted, uniq)
+        valid = (pos < len(self._vocab_sorted)) & (
+            self._vocab_sorted[pos.clip(max=len(self._vocab_sorted) - 1)] == uniq
+        )
+        idx = pos[valid].astype(np.int32)
+        tfidf = (counts[valid] / len(arr)).astype(np.float32) * self._idf_vec[idx]
+        return idx, tfidf
+
+    def _build_matrix(self, tokens_per_entry: list[list[str]]) -> None:
+        """Assemble one L2-normalised CSR matrix over the whole history.
+
+        With every row unit-length, cosine against a unit query collapses
+        to a single sparse matvec - one BLAS-style pass instead of a
+        Python loop per entry.
+        """
+        indptr = [0]
+        index_parts = []
+        data_parts = []
+        for tokens in tokens_per_entry:
+            idx, tfidf = self._vectorize_np(tokens)
+            index_parts.append(idx)
+            data_parts.append(tfidf)
+            indptr.append(indptr[-1] + len(idx))
+        matrix = csr_matrix(
+            (
+                np.concatenate(data_parts)
+                if data_parts
+                else np.empty(0, dtype=np.float32),
+                np.concatenate(index_parts)
+                if index_parts
+                else np.empty(0, dtype=np.int32),
+                np.asarray(indptr, dtype=np.int32),
+            ),
+            shape=(len(tokens_per_entry), len(self._vocab_sorted)),
+        )
+        norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A.ravel()
+        norms[norms == 0.0] = 1.0
+        matrix = matrix.multiply(1.0 / norms[:, None]).tocsr()
+        self._matrix = matrix
+
+    def _query_row(self, text: str):
+        idx, tfidf = self._vectorize_np(self._tokenize(text))
+        row = csr_matrix(
+            (
+                tfidf,
+                idx,
+                np.asarray([0, len(idx)], dtype=np.int32),
+            ),
+            shape=(1, len(self._vocab_sorted)),
+        )
+        norm = math.sqrt(float((tfidf * tfidf).sum()))
+        if norm:
+            row = row.multiply(1.0 / norm).tocsr()
+        return row
+
+    @staticmethod
+    def _dot_sorted(ids1, vals1, ids2, vals2) -> float:
+        """Two-pointer merge dot product over sorted id columns."""
+        # Lengths bound once: len() per iteration is two C calls the
+        # interpreter re-dispatches on every pass of a hot loop.
+        n1 = len(ids1)
+        n2 = len(ids2)
+        i = 0
+        j = 0
+        dot = 0.0
+        while i < n1 and j < n2:
+            a = ids1[i]
+            b = ids2[j]
+            if a == b:
+                dot += vals1[i] * vals2[j]
+                i += 1
+                j += 1
+            elif a < b:
+                i += 1
+            else:
+                j += 1
+        return dot
+
+    def _score_torch(self, query_row):
+        """Bulk cosine on the GPU; returns None when CUDA is absent or
+        the densified matrix would not fit, leaving the sparse matvec to
+        handle it."""
+        if self._dense is False:
+            return None
+        if self._dense is None:
+            if (
+                not torch.cuda.is_available()
+                or self._matrix.shape[0] * self._matrix.shape[1] > _DENSE_LIMIT
+            ):
+                self._dense = False
+                return None
+            # fp16 halves transfer and bandwidth; cosine tolerates the
+            # precision loss comfortably.
+            self._dense = torch.from_numpy(self._matrix.toarray()).to("cuda").half()
+        query = torch.from_numpy(query_row.toarray().ravel()).to("cuda").half()
+        scores = torch.nn.functional.cosine_similarity(
+            self._dense, query.unsqueeze(0), dim=1
+        )
+        return scores.float().cpu().numpy()
+
+    def _score_similar(
+        self, query_text: str, archetype: str, domain: str
+    ) -> list[tuple[HistoryEntry, float]]:
+        if self._matrix is not None and len(self.history):
+            # Bulk path: one sparse matvec scores every entry, boosts land
+            # as vectorised adds, and argpartition selects top-k in O(N).
+            query_row = self._query_row(query_text)
+            scores = self._score_torch(query_row) if _HAVE_TORCH else None
+            if scores is None:
+                scores = (self._matrix @ query_row.T).toarray().ravel()
+            if archetype:
+                scores += ARCHETYPE_BOOST * np.fromiter(
+                    (entry.archetype == archetype for entry in self.history),
+                    dtype=np.float32,
+                    count=len(self.history),
+                )
+            if domain:
+                scores += DOMAIN_BOOST * np.fromiter(
+                    (entry.domain == domain for entry in self.history),
+                    dtype=np.float32,
+                    count=len(self.history),
+                )
+            k = min(MAX_SIMILAR, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k] if k else []
+            ranked = sorted(
+                ((self.history[i], float(scores[i])) for i in top),
+                key=lambda pair: pair[1],
+                reverse=True,
+            )
+            return [
+                (entry, score) for entry, score in ranked if score >= SIMILARITY_FLOOR
+            ]
+
+        query_ids, query_vals, _ = self._vector_columns(
+            self._tokenize(query_text), self._idf_vec, self._token_id
+        )
+        # Upper bound per entry: dot <= max(entry weights) * sum(query
+        # weights). Entries that cannot reach the floor even in the best
+        # case skip the merge entirely; matching boosts still apply below.
+        query_val_sum = sum(query_vals)
+        if not _HAVE_NUMBA:
+            # Inverted-index pruning: only entries sharing at least one
+            # query token can have a nonzero dot product, so collect them
+            # from the postings lists and never touch the rest's vectors.
+            candidates: set[int] = set()
+            postings = self._postings
+            for token_id in query_ids:
+                candidates.update(postings.get(token_id, ()))
+        scored: list[tuple[HistoryEntry, float]] = []
+        for doc_id, entry in enumerate(self.history):
+            if entry.max_val * query_val_sum < SIMILARITY_FLOOR:
+                score = 0.0
+            elif _HAVE_NUMBA:
+                score = min(
+                    float(_dot_sorted_nb(query_ids, query_vals, entry.ids, entry.vals)),
+                    1.0,
+                )
+            elif doc_id in candidates:
+                score = min(
+                    self._dot_sorted(query_ids, query_vals, entry.ids, entry.vals), 1.0
+                )
+            else:
+                # The boost sweep is a cheap field compare per entry.
+                score = 0.0
+            if archetype and entry.archetype == archetype:
+                score += ARCHETYPE_BOOST
+            if domain and entry.domain == domain:
+                score += DOMAIN_BOOST
+            if score >= SIMILARITY_FLOOR:
+                scored.append((entry, score))
+        # O(N log k) selection, no fully sorted intermediate list.
+        return heapq.nlargest(MAX_SIMILAR, scored, key=operator.itemgetter(1))
+
+    # ------------------------------------------------------------ consolidate
+
+    @staticmethod
+    def _consolidate_lessons(
+        similar: list[tuple[HistoryEntry, float]],
+    ) -> dict[str, list[str]]:
+        """Merge lessons across the matched entries, deduplicating near-
+        identical phrasings and keeping the best-supported three per
+        category (weighted by the similarity of their source entry)."""
+        consolidated: dict[str, list[str]] = {}
+        for category in _LESSON_CATEGORIES:
+            # Int keys from hashing the first four word tokens: no split
+            # list, no slice copy, no joined string per lesson, and
+            # int-keyed dict inserts beat str-keyed ones.
+            bucket: dict[int, tuple[str, float]] = {}
+            for entry, score in similar:
+                for text in entry.lessons.get(category, []):
+                    text = text.strip()
+                    if not text:
+                        continue
+                    key = hash(tuple(_findall_words(text.lower())[:4]))
+                    existing = bucket.get(key)
+                    if existing is None or score > existing[1]:
+                        bucket[key] = (text, score)
+            top = heapq.nlargest(3, bucket.values(), key=operator.itemgetter(1))
+            consolidated[category] = [text for text, _ in top]
+        return consolidated
+
+    # ------------------------------------------------------------------ api
+
+    def generate_lessons(
+        self, title: str, archetype: str, domain: str, purpose: str
+    ) -> dict[str, Any]:
+        self._load_history()
+        query_text = f"{title} {archetype} {domain} {purpose}"
+        similar = self._score_similar(query_text, archetype, domain)
+        return {
+            "proposedInitiative": title,
+            "similarInitiatives": [
+                {
+                    "initiative": entry.initiative,
+                    "similarity": round(score, 3),
+                    "archetype": entry.archetype,
+                    "domain": entry.domain,
+                    "url": entry.url,
+                }
+                for entry, score in similar
+            ],
+            "consolidatedLessons": self._consolidate_lessons(similar),
+        }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate lessons for a proposed initiative"
+    )
+    parser.add_argument("--title", required=True)
+    parser.add_argument("--archetype", default="")
+    parser.add_argument("--domain", default="")
+    parser.add_argument("--purpose", default="")
+    parser.add_argument("--history", type=Path, default=_DEFAULT_HISTORY)
+    parser.add_argument("--output", type=Path, default=_DEFAULT_OUTPUT)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    generator = InitiativeLessonsGenerator(args.history)
+    result = generator.generate_lessons(
+        args.title, args.archetype, args.domain, args.purpose
+    )
+    args.output.write_text(
+        json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    matches = len(result["similarInitiatives"])
+    print(
+        f"🧭 Matched {matches} similar initiative(s); lessons written to {args.output}"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,424 @@
+"""Provision a SPECTRA service repository from a slash command.
+
+Triggered when a steward comments ``/create-service-repo name=<camelCase>
+domain=<domain> ...`` on a provisioning issue. Creates the repository in
+the organisation, waits for GitHub to finish provisioning, seeds the
+canonical label set from this repo's ``labels.json``, drops the
+organisational metadata file and a baseline README, then reports back on
+the triggering issue.
+
+Provide a token via ``--token`` or ``GITHUB_TOKEN``; the comment body
+normally arrives via ``COMMENT_BODY`` from the workflow event payload.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import concurrent.futures
+import functools
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # orjson parses bytes directly; stdlib json remains a full fallback.
+    import orjson
+
+    _loads = orjson.loads
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _loads = json.loads
+
+_DEFAULT_API = os.environ.get("GITHUB_API", "https://api.github.com")
+# Sidecar cache for the canonical label set: the file changes rarely, and a
+# conditional GET answered with 304 costs no rate-limit budget and no body.
+_LABELS_CACHE = Path.home() / ".cache" / "spectra" / "labels.json"
+
+# Compiled once at import: parse_slash_command and the name check run per
+# invocation, and re.search with a literal pattern pays a cache lookup and
+# hash on every call even when the compiled pattern is already cached.
+_SLASH_RE = re.compile(r"^/create-service-repo\b(.*)$", re.MULTILINE)
+_PARAM_RE = re.compile(r'(\w+)=("[^"]*"|\S+)')
+_CAMEL_RE = re.compile(r"^[a-z][a-zA-Z0-9]*$")
+
+
+# Constant templates built once at import; each call only pays the two
+# substitutions instead of reassembling ~1 KB of markdown.
+_BASELINE_README_TMPL = """# {repo_name}
+
+## 🏛️ Organisational Structure
+
+**Dream:** SPECTRA
+**Archetype:** TBD
+**Domain:** {domain}
+
+## 📦 Purpose
+
+Service repository provisioned by the SPECTRA assistant. Replace this
+section with the service's purpose once the first epic lands.
+
+## 🧭 Conventions
+
+- British English throughout
+- camelCase repository and field names
+- Canonical labels are seeded from the organisation profile
+"""
+_SUCCESS_COMMENT_TMPL = (
+    "✅ Repository **{repo_name}** provisioned: "
+    "https://github.com/{org}/{repo_name}\n\n"
+    "Canonical labels, organisational metadata and a baseline "
+    "README are in place."
+)
+_FAILURE_COMMENT_TMPL = "❌ Could not provision **{repo_name}**.{detail}"
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_slash_command_cached(body: str) -> tuple[tuple[str, str], ...] | None:
+    """Regex work for parse_slash_command, memoized per comment body.
+
+    Retries and multiple workflow triggers replay identical payloads, so
+    the two regex passes run once per distinct body. The frozen tuple
+    return keeps the cached value immutable; callers build fresh dicts.
+    """
+    command_match = _SLASH_RE.search(body)
+    if not command_match:
+        return None
+    return tuple(
+        (match.group(1), match.group(2).strip('"'))
+        for match in _PARAM_RE.finditer(command_match.group(1))
+    )
+
+
+class ServiceRepositoryGenerator:
+    """Drives the provisioning flow for one service repository."""
+
+    def __init__(self, org: str, token: str, api_base: str = _DEFAULT_API) -> None:
+        self.org = org
+        self.api_base = api_base
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        }
+        # One pooled session for the whole flow: label seeding alone issues
+        # dozens of tiny JSON requests, and a fresh TCP+TLS handshake per
+        # request would dominate their cost.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=frozenset(["GET", "PUT", "PATCH"]),
+                ),
+            ),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ------------------------------------------------------------------ parse
+
+    def parse_slash_command(self, body: str) -> dict[str, str] | None:
+        """Extract ``key=value`` parameters from a ``/create-service-repo`` line."""
+        params = _parse_slash_command_cached(body)
+        return None if params is None else dict(params)
+
+    @staticmethod
+    def _is_valid_camel_case(name: str) -> bool:
+        return bool(_CAMEL_RE.match(name))
+
+    # ------------------------------------------------------------------ github
+
+    def check_repository_exists(self, repo_name: str) -> bool:
+        # Only the status code matters, so HEAD skips the multi-KB repo JSON
+        # the GET variant would download on every provisioning poll.
+        response = self.session.head(
+            f"{self.api_base}/repos/{self.org}/{repo_name}", allow_redirects=True
+        )
+        return response.status_code == 200
+
+    def create_repository(self, repo_name: str, description: str) -> bool:
+        response = self.session.post(
+            f"{self.api_base}/orgs/{self.org}/repos",
+            json={
+                "name": repo_name,
+                "description": description,
+                "private": True,
+                "has_issues": True,
+                "has_projects": True,
+                "auto_init": False,
+            },
+        )
+        return response.status_code == 201
+
+    def _wait_for_repo_ready(self, repo_name: str, max_attempts: int = 10) -> bool:
+        """Poll until the freshly created repository answers on the API.
+
+        GitHub usually provisions in well under a second, so the first
+        probes come quickly; the delay doubles from 100 ms up to a 2 s
+        ceiling so a slow provision still backs off instead of hammering.
+        """
+        delay = 0.1
+        for _ in range(max_attempts):
+            if self.check_repository_exists(repo_name):
+                return True
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+        return False
+
+    def _seed_canonical_labels(self, repo_name: str) -> list[str]:
+        """Copy the canonical label set onto the new repository.
+
+        Returns a list of warnings for labels that could not be applied;
+        label trouble should never fail provisioning outright.
+        """
+        warnings: list[str] = []
+        labels = self._fetch_canonical_labels()
+        if labels is None:
+            return ["could not fetch canonical labels.json"]
+        # One listing round trip, then diff locally: only labels that are
+        # missing or differ by colour/description cost a request, so the
+        # common "already seeded" case issues almost no writes at all.
+        existing = self._list_existing_labels(repo_name)
+        pending = [
+            (label, label["name"] in existing)
+            for label in labels
+            if existing.get(label["name"])
+            != (label.get("color", "ededed"), label.get("description", ""))
+        ]
+        # Each remaining label is an independent request, so overlap them.
+        # Eight workers keeps wall time near one round trip per batch of
+        # eight while staying under GitHub's secondary-rate-limit
+        # heuristics; the pooled session's urllib3 pool is thread-safe.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            for warning in executor.map(
+                lambda item: self._create_or_update_label(repo_name, *item), pending
+            ):
+                if warning:
+                    warnings.append(warning)
+        return warnings
+
+    def _fetch_canonical_labels(self) -> list[dict[str, Any]] | None:
+        """Fetch labels.json from the profile repo, via the on-disk ETag cache.
+
+        On a 304 the cached decode is reused wholesale - no body download,
+        no base64, no JSON parse. The cache is an optimisation; any trouble
+        reading or writing it just falls back to a plain fetch.
+        """
+        cached: dict[str, Any] = {}
+        try:
+            cached = json.loads(_LABELS_CACHE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+        response = self.session.get(
+            f"{self.api_base}/repos/{self.org}/.github/contents/labels.json",
+            headers=headers,
+        )
+        if response.status_code == 304:
+            return cached.get("content")
+        if response.status_code != 200:
+            return None
+        # a2b_base64 skips b64decode's alt-chars handling, and _loads parses
+        # the raw bytes, so the decoded JSON never exists as an intermediate
+        # Python string.
+        labels = _loads(binascii.a2b_base64(response.json()["content"]))
+        etag = response.headers.get("ETag", "")
+        if etag:
+            try:
+                _LABELS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                _LABELS_CACHE.write_text(
+                    json.dumps({"etag": etag, "content": labels}), encoding="utf-8"
+                )
+            except OSError:
+                pass
+        return labels
+
+    def _list_existing_labels(self, repo_name: str) -> dict[str, tuple[str, str]]:
+        """Return {name: (color, description)} for the repo's current labels."""
+        existing: dict[str, tuple[str, str]] = {}
+        url = f"{self.api_base}/repos/{self.org}/{repo_name}/labels"
+        params: dict[str, Any] = {"per_page": 100}
+        while url:
+            response = self.session.get(url, params=params)
+            if response.status_code != 200:
+                break
+            for label in response.json():
+                existing[label["name"]] = (
+                    label.get("color", ""),
+                    label.get("description") or "",
+                )
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else ""
+            params = {}
+        return existing
+
+    def _create_or_update_label(
+        self, repo_name: str, label: dict[str, Any], exists: bool
+    ) -> str | None:
+        payload = {
+            "name": label["name"],
+            "color": label.get("color", "ededed"),
+            "description": label.get("description", ""),
+        }
+        if exists:
+            response = self.session.patch(
+                f"{self.api_base}/repos/{self.org}/{repo_name}/labels/{label['name']}",
+                json=payload,
+            )
+            if response.status_code == 200:
+                return None
+        else:
+            response = self.session.post(
+                f"{self.api_base}/repos/{self.org}/{repo_name}/labels", json=payload
+            )
+            if response.status_code == 201:
+                return None
+        return f"label '{label['name']}' failed (HTTP {response.status_code})"
+
+    def _create_file(
+        self, repo_name: str, path: str, content: str, message: str
+    ) -> bool:
+        response = self.session.put(
+            f"{self.api_base}/repos/{self.org}/{repo_name}/contents/{path}",
+            json={
+                "message": message,
+                "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+            },
+        )
+        return response.status_code in (200, 201)
+
+    # ------------------------------------------------------------------ content
+
+    def _add_organisational_metadata(self, repo_name: str, domain: str) -> bool:
+        # The metadata shape is fixed, so format the constant template
+        # directly rather than building a dict and YAML-dumping it per call.
+        metadata_yaml = f"dream: SPECTRA\narchetype: TBD\ndomain: {domain}\nrepository: {repo_name}\n"
+        return self._create_file(
+            repo_name,
+            ".spectra/metadata.yml",
+            metadata_yaml,
+            "Add organisational metadata",
+        )
+
+    def _add_baseline_readme(self, repo_name: str, domain: str) -> bool:
+        readme_content = _BASELINE_README_TMPL.format(
+            repo_name=repo_name, domain=domain
+        )
+        return self._create_file(
+            repo_name, "README.md", readme_content, "Add baseline README"
+        )
+
+    def post_response_comment(
+        self, issue_number: int, success: bool, repo_name: str, detail: str = ""
+    ) -> None:
+        if success:
+            body = _SUCCESS_COMMENT_TMPL.format(repo_name=repo_name, org=self.org)
+        else:
+            body = _FAILURE_COMMENT_TMPL.format(
+                repo_name=repo_name,
+                detail=f"\n\n```\n{detail}\n```" if detail else "",
+            )
+        self.session.post(
+            f"{self.api_base}/repos/{self.org}/.github/issues/{issue_number}/comments",
+            json={"body": body},
+        )
+
+    # ------------------------------------------------------------------ flow
+
+    def provision(self, issue_number: int, comment_body: str) -> int:
+        params = self.parse_slash_command(comment_body)
+        if params is None:
+            print("ℹ️  No /create-service-repo command found; nothing to do.")
+            return 0
+        repo_name = params.get("name", "")
+        domain = params.get("domain", "unassigned")
+        description = params.get("description", f"SPECTRA {domain} service")
+        if not self._is_valid_camel_case(repo_name):
+            self.post_response_comment(
+                issue_number,
+                False,
+                repo_name or "(missing name)",
+                "Repository names must be camelCase, e.g. name=customerBilling.",
+            )
+            return 1
+        if self.check_repository_exists(repo_name):
+            self.post_response_comment(
+                issue_number,
+                False,
+                repo_name,
+                "A repository with that name already exists.",
+            )
+            return 1
+        if not self.create_repository(repo_name, description):
+            self.post_response_comment(
+                issue_number, False, repo_name, "Repository creation failed."
+            )
+            return 1
+        if not self._wait_for_repo_ready(repo_name):
+            self.post_response_comment(
+                issue_number, False, repo_name, "Repository never became ready."
+            )
+            return 1
+        warnings = self._seed_canonical_labels(repo_name)
+        self._add_organisational_metadata(repo_name, domain)
+        self._add_baseline_readme(repo_name, domain)
+        detail = "\n".join(warnings)
+        self.post_response_comment(issue_number, True, repo_name, detail)
+        for warning in warnings:
+            print(f"⚠️  {warning}", file=sys.stderr)
+        print(f"🚀 Provisioned {self.org}/{repo_name}")
+        return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Provision a SPECTRA service repository"
+    )
+    parser.add_argument(
+        "--org", default=os.environ.get("GITHUB_ORG", "SPECTRADataSolutions")
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("GITHUB_TOKEN"),
+        help="GitHub token (env: GITHUB_TOKEN)",
+    )
+    parser.add_argument(
+        "--issue", type=int, default=int(os.environ.get("ISSUE_NUMBER", "0"))
+    )
+    parser.add_argument(
+        "--comment-body",
+        default=os.environ.get("COMMENT_BODY", ""),
+        help="Triggering comment body (env: COMMENT_BODY)",
+    )
+    parser.add_argument("--api", default=_DEFAULT_API, help="GitHub API base URL")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    if not args.token:
+        raise SystemExit("Missing --token (or GITHUB_TOKEN)")
+    generator = ServiceRepositoryGenerator(args.org, args.token, args.api)
+    try:
+        exit_code = generator.provision(args.issue, args.comment_body)
+    finally:
+        generator.close()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,346 @@
+"""Score initiative readiness and sync the readiness label on the issue.
+
+Assesses how complete an initiative's structured fields are - purpose
+clarity, measurable success indicators, concrete deliverables, documented
+constraints and reviewed lessons - and maps the score onto one of the
+``readiness:*`` labels. Run with ``--dry-run`` to print the assessment
+without touching GitHub.
+
+Provide a token via ``--token`` or ``GITHUB_TOKEN`` when labelling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import concurrent.futures
+import json
+import os
+import re
+import sys
+from typing import Any
+
+try:  # orjson parses bytes directly in C; stdlib json remains a full fallback.
+    import orjson
+
+    _loads = orjson.loads
+except ModuleNotFoundError:  # pragma: no cover - exercised on minimal installs
+    _loads = json.loads
+
+_DEFAULT_API = os.environ.get("GITHUB_API", "https://api.github.com")
+
+# Compiled once at import: the scoring path runs these per assessment, and
+# a single alternation per field replaces one re.search cache probe per
+# candidate pattern.
+_MEASURABLE_RE = re.compile(r"\d+%|\d+\s*min|\d+\s*days|<=?\d+|>=?\d+")
+_SPECIFIC_RE = re.compile(
+    r"\.(py|yml|md|json)|workflow|script|system|process", re.IGNORECASE
+)
+
+# Thresholds and names as a bisect table: one binary search replaces the
+# branch chain, and adding a level means editing data, not control flow.
+# bisect_left keeps the strict > semantics at the boundaries.
+_LEVEL_THRESHOLDS = (50, 70, 85)
+_LEVEL_NAMES = ("not-ready", "needs-work", "mostly-ready", "ready")
+
+# Level -> label mappings are fixed, so both directions are precomputed:
+# each _determine_labels call is two dict lookups rather than a dict build
+# plus a comprehension over it.
+_READINESS_LABELS = {
+    "ready": "readiness:ready",
+    "mostly-ready": "readiness:mostly-ready",
+    "needs-work": "readiness:needs-work",
+    "not-ready": "readiness:not-ready",
+}
+_REMOVE_BY_LEVEL = {
+    level: tuple(label for key, label in _READINESS_LABELS.items() if key != level)
+    for level in _READINESS_LABELS
+}
+
+_REQUIRED_FIELDS = ("archetype", "domain", "initiativeTitle", "purpose", "scope")
+_SCORED_FIELDS = _REQUIRED_FIELDS + (
+    "successIndicators",
+    "deliverables",
+    "capabilityAreas",
+    "constraints",
+    "lessonsFromPastInitiatives",
+)
+
+
+class InitiativeReadinessLabeller:
+    """Scores one initiative and keeps its readiness label in step."""
+
+    def __init__(
+        self, org: str, repo: str, token: str, api_base: str = _DEFAULT_API
+    ) -> None:
+        self.org = org
+        self.repo = repo
+        self.base_url = api_base.rstrip("/")
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        }
+        self._session: Any = None
+        # Workflow re-runs often score identical issue bodies (comment
+        # edits, label toggles); cache assessments per payload in-process.
+        self._score_cache: dict[tuple[Any, ...], tuple[float, dict[str, float]]] = {}
+
+    @property
+    def session(self) -> Any:
+        """Pooled session, built (and ``requests`` imported) on first use.
+
+        Scoring-only runs (``--dry-run`` or no issue number) never touch
+        GitHub, so they skip the requests/urllib3 import cost entirely.
+        Keep-alive skips the TCP+TLS handshake from the second request on,
+        and the mounted Retry backs off automatically on 429/5xx.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            self._session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+                    ),
+                ),
+            )
+        return self._session
+
+    # ------------------------------------------------------------------ score
+
+    def assess_readiness(
+        self,
+        initiative_data: dict[str, Any],
+        lessons_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        score, breakdown = self._calculate_readiness_score(
+            initiative_data, lessons_data
+        )
+        readiness_level = self._determine_readiness_level(score)
+        labels_to_add, labels_to_remove = self._determine_labels(readiness_level)
+        return {
+            "score": score,
+            "readinessLevel": readiness_level,
+            "breakdown": breakdown,
+            "labelsToAdd": labels_to_add,
+            "labelsToRemove": labels_to_remove,
+        }
+
+    def _calculate_readiness_score(
+        self, initiative_data: dict[str, Any], lessons_data: dict[str, Any] | None
+    ) -> tuple[float, dict[str, float]]:
+        """Score an initiative out of 100, returning the per-check breakdown."""
+        # One .get + .strip per field up front; the checks below read the
+        # same values several times, so they hit this view instead of
+        # re-stripping potentially large strings.
+        v = {
+            field: (initiative_data.get(field) or "").strip()
+            for field in _SCORED_FIELDS
+        }
+
+        # The scorer is pure over the stripped scored fields plus whether
+        # similar initiatives were found, so that pair is the whole cache
+        # key - and, being strings only, it is always hashable even when
+        # the raw payload carries list- or dict-valued extras.
+        key = (
+            tuple(v.values()),
+            bool(lessons_data and lessons_data.get("similarInitiatives")),
+        )
+        cached = self._score_cache.get(key)
+        if cached is not None:
+            return cached
+        breakdown: dict[str, float] = {}
+
+        # Required fields: 8 points each.
+        present = sum(1 for field in _REQUIRED_FIELDS if v[field])
+        breakdown["requiredFields"] = present * 8.0
+
+        # Purpose clarity: one crisp sentence of reasonable length.
+        purpose = v["purpose"]
+        # "At most one full stop" needs a count, not a list of sentences.
+        if purpose.count(".") <= 1 and 50 <= len(purpose) <= 200:
+            breakdown["purposeClarity"] = 10.0
+        else:
+            breakdown["purposeClarity"] = 0.0
+
+        # Measurable success indicators (percentages, durations, bounds).
+        success_indicators = v["successIndicators"]
+        if success_indicators and _MEASURABLE_RE.search(success_indicators):
+            breakdown["measurableIndicators"] = 15.0
+        else:
+            breakdown["measurableIndicators"] = 0.0
+
+        # Deliverables that name concrete artefacts rather than aspirations.
+        deliverables = v["deliverables"]
+        if deliverables and _SPECIFIC_RE.search(deliverables):
+            breakdown["specificDeliverables"] = 15.0
+        else:
+            breakdown["specificDeliverables"] = 0.0
+
+        # At least two capability areas scoped in.
+        capability_areas = v["capabilityAreas"]
+        # Counting non-blank lines needs no list of stripped copies.
+        areas_count = sum(1 for area in capability_areas.splitlines() if area.strip())
+        breakdown["capabilityAreas"] = 10.0 if areas_count >= 2 else 0.0
+
+        # Constraints documented at all.
+        constraints = v["constraints"]
+        constraint_count = sum(1 for line in constraints.splitlines() if line.strip())
+        breakdown["constraints"] = 5.0 if constraint_count >= 1 else 0.0
+
+        # Lessons from past initiatives reviewed.
+        lessons_field = v["lessonsFromPastInitiatives"]
+        if lessons_field or (lessons_data and lessons_data.get("similarInitiatives")):
+            breakdown["lessonsReviewed"] = 5.0
+        else:
+            breakdown["lessonsReviewed"] = 0.0
+
+        result = (sum(breakdown.values()), breakdown)
+        self._score_cache[key] = result
+        return result
+
+    @staticmethod
+    def _determine_readiness_level(score: float) -> str:
+        return _LEVEL_NAMES[bisect.bisect_left(_LEVEL_THRESHOLDS, score)]
+
+    @staticmethod
+    def _determine_labels(readiness_level: str) -> tuple[list[str], list[str]]:
+        return [_READINESS_LABELS[readiness_level]], list(
+            _REMOVE_BY_LEVEL[readiness_level]
+        )
+
+    # ------------------------------------------------------------------ labels
+
+    def apply_readiness_labels(
+        self, issue_number: int, labels_to_add: list[str], labels_to_remove: list[str]
+    ) -> bool:
+        if self._set_labels(issue_number, labels_to_add, labels_to_remove):
+            return True
+        # The batched replacement failed (e.g. a token allowed to add and
+        # remove labels but not replace the whole set); fall back to the
+        # strict add-then-delete semantics.
+        success = self._add_labels(issue_number, labels_to_add)
+        return self._remove_labels(issue_number, labels_to_remove) and success
+
+    def _set_labels(
+        self, issue_number: int, labels_to_add: list[str], labels_to_remove: list[str]
+    ) -> bool:
+        """Replace the issue's label set in one PUT.
+
+        One GET to read the current labels plus one PUT with the final set,
+        instead of a POST for the additions and a DELETE per removal - two
+        round trips however many labels change hands.
+        """
+        issue_url = (
+            f"{self.base_url}/repos/{self.org}/{self.repo}/issues/{issue_number}"
+        )
+        response = self.session.get(f"{issue_url}/labels")
+        if response.status_code != 200:
+            return False
+        current = {label["name"] for label in response.json()}
+        final = (current - set(labels_to_remove)) | set(labels_to_add)
+        if final == current:
+            return True
+        response = self.session.put(
+            f"{issue_url}/labels", json={"labels": sorted(final)}
+        )
+        return response.status_code == 200
+
+    def _add_labels(self, issue_number: int, labels: list[str]) -> bool:
+        if not labels:
+            return True
+        response = self.session.post(
+            f"{self.base_url}/repos/{self.org}/{self.repo}/issues/{issue_number}/labels",
+            json={"labels": labels},
+        )
+        return response.status_code == 200
+
+    def _remove_labels(self, issue_number: int, labels: list[str]) -> bool:
+        if not labels:
+            return True
+        # The deletes are independent I/O, so overlap them; the session's
+        # urllib3 pool is thread-safe. 404 just means the label was not on
+        # the issue.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(labels), 5)
+        ) as executor:
+            responses = executor.map(
+                lambda label: self.session.delete(
+                    f"{self.base_url}/repos/{self.org}/{self.repo}"
+                    f"/issues/{issue_number}/labels/{label}"
+                ),
+                labels,
+            )
+            return all(response.status_code in (200, 404) for response in responses)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Assess and label initiative readiness"
+    )
+    parser.add_argument(
+        "--org", default=os.environ.get("GITHUB_ORG", "SPECTRADataSolutions")
+    )
+    parser.add_argument("--repo", default=os.environ.get("GITHUB_REPO", ".github"))
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("GITHUB_TOKEN"),
+        help="GitHub token (env: GITHUB_TOKEN)",
+    )
+    parser.add_argument(
+        "--initiative-file", required=True, help="Initiative fields JSON"
+    )
+    parser.add_argument("--lessons-file", help="Optional lessons-learned JSON")
+    parser.add_argument("--issue-number", type=int, help="Issue to label")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Assess without labelling"
+    )
+    parser.add_argument("--api", default=_DEFAULT_API, help="GitHub API base URL")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    # Bytes straight into the parser: no text decode pass, and orjson
+    # (when present) does the whole parse in C.
+    with open(args.initiative_file, "rb") as f:
+        initiative_data = _loads(f.read())
+    lessons_data = None
+    if args.lessons_file:
+        with open(args.lessons_file, "rb") as f:
+            lessons_data = _loads(f.read())
+    labeller = InitiativeReadinessLabeller(
+        args.org, args.repo, args.token or "", args.api
+    )
+    assessment = labeller.assess_readiness(initiative_data, lessons_data)
+    print(
+        f"🎯 Readiness score: {assessment['score']:.0f}/100 ({assessment['readinessLevel']})"
+    )
+    for check, points in assessment["breakdown"].items():
+        print(f"   {'✅' if points else '❌'} {check}: {points:.0f}")
+    if args.dry_run or not args.issue_number:
+        return 0
+    if not args.token:
+        raise SystemExit("Missing --token (or GITHUB_TOKEN)")
+    applied = labeller.apply_readiness_labels(
+        args.issue_number, assessment["labelsToAdd"], assessment["labelsToRemove"]
+    )
+    if not applied:
+        print("⚠️  Some label updates failed", file=sys.stderr)
+        return 1
+    print(f"🏷️  Labelled issue #{args.issue_number} as {assessment['labelsToAdd'][0]}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())